@@ -1,11 +1,18 @@
 """Extensions for saving and loading the state of a training process."""
+import io
 import os.path
 import logging
+import shutil
+import sys
+import threading
+import traceback
+
+import six
 
 from blocks.extensions import SimpleExtension
 from blocks.utils import reraise_as
 from blocks.serialization import (secure_dump, load, dump_and_add_to_dump,
-                                  load_parameters)
+                                  load_parameters, DEFAULT_PROTOCOL)
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +50,24 @@ class Checkpoint(SimpleExtension):
         but not the whole main loop. Defaults to `True`.
     use_cpickle : bool
         See documentation of :func:`~blocks.serialization.dump`.
+    protocol : int, optional
+        The pickling protocol to use, see documentation of
+        :func:`~blocks.serialization.dump`.
+    compress : bool
+        Compress the checkpoint with gzip, see documentation of
+        :func:`~blocks.serialization.dump`. Can not be combined with
+        `save_separately`. Defaults to `False`.
+    compresslevel : int
+        The gzip compression level used if `compress` is `True`, from 1
+        (fastest) to 9 (smallest). Defaults to 1.
+    background : bool
+        If `True`, the main loop is serialized into an in-memory archive
+        and only writing it to the disk is done by a background thread.
+        Training still waits for the pickling, and the whole archive is
+        held in memory until it is written. A new checkpoint waits for
+        the previous write to finish, and the write started after
+        training or on an error is always waited for. Defaults to
+        `False`.
 
     Notes
     -----
@@ -54,10 +79,18 @@ class Checkpoint(SimpleExtension):
       (and vice-versa). Therefore using this extension binds you to using
       only one kind of device.
 
+    When writing in the background, the `SAVED_TO` record is made as
+    soon as the write is scheduled. An error in the background write is
+    logged when it happens and raised by the next checkpoint.
 
     """
     def __init__(self, path, parameters=None, save_separately=None,
-                 save_main_loop=True, use_cpickle=False, **kwargs):
+                 save_main_loop=True, use_cpickle=False,
+                 protocol=DEFAULT_PROTOCOL, compress=False, compresslevel=1,
+                 background=False, **kwargs):
+        if compress and save_separately:
+            raise ValueError("save_separately can't be used with a "
+                             "compressed checkpoint")
         kwargs.setdefault("after_training", True)
         super(Checkpoint, self).__init__(**kwargs)
         self.path = path
@@ -65,6 +98,49 @@ class Checkpoint(SimpleExtension):
         self.save_separately = save_separately
         self.save_main_loop = save_main_loop
         self.use_cpickle = use_cpickle
+        self.protocol = protocol
+        self.compress = compress
+        self.compresslevel = compresslevel
+        self.background = background
+        self._writer = None
+        self._writer_error = None
+
+    def __getstate__(self):
+        # The background writer thread can not be pickled
+        state = dict(self.__dict__)
+        del state['_writer']
+        del state['_writer_error']
+        return state
+
+    def __setstate__(self, state):
+        # Checkpoints pickled before these options existed
+        state.setdefault('protocol', DEFAULT_PROTOCOL)
+        state.setdefault('compress', False)
+        state.setdefault('compresslevel', 1)
+        state.setdefault('background', False)
+        self.__dict__.update(state)
+        self._writer = None
+        self._writer_error = None
+
+    def _write(self, buffer_, path):
+        try:
+            secure_dump(buffer_, path, dump_function=_copy_buffer)
+        except Exception:
+            logger.error(traceback.format_exc())
+            self._writer_error = sys.exc_info()
+
+    def wait(self):
+        """Wait until the checkpoint written in background is on disk.
+
+        Reraises the exception the background write failed with, if any.
+
+        """
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            six.reraise(*error)
 
     def do(self, callback_name, *args):
         """Pickle the main loop object to the disk.
@@ -77,6 +153,7 @@ class Checkpoint(SimpleExtension):
         logger.info("Checkpointing has started")
         _, from_user = self.parse_args(callback_name, args)
         try:
+            self.wait()
             path = self.path
             if from_user:
                 path, = from_user
@@ -90,11 +167,28 @@ class Checkpoint(SimpleExtension):
             object_ = None
             if self.save_main_loop:
                 object_ = self.main_loop
-            secure_dump(object_, path,
-                        dump_function=dump_and_add_to_dump,
-                        parameters=self.parameters,
-                        to_add=to_add,
-                        use_cpickle=self.use_cpickle)
+            dump_kwargs = dict(parameters=self.parameters,
+                               to_add=to_add,
+                               use_cpickle=self.use_cpickle,
+                               protocol=self.protocol,
+                               compress=self.compress,
+                               compresslevel=self.compresslevel)
+            if self.background:
+                # Serialize now, so that the checkpoint is not affected
+                # by the training that continues during the write.
+                buffer_ = io.BytesIO()
+                dump_and_add_to_dump(object_, buffer_, in_memory=True,
+                                     **dump_kwargs)
+                self._writer = threading.Thread(
+                    target=self._write, args=(buffer_, path))
+                self._writer.start()
+                if callback_name in ('after_training', 'on_error',
+                                     'on_interrupt'):
+                    self.wait()
+            else:
+                secure_dump(object_, path,
+                            dump_function=dump_and_add_to_dump,
+                            **dump_kwargs)
         except Exception:
             path = None
             raise
@@ -105,6 +199,11 @@ class Checkpoint(SimpleExtension):
             logger.info("Checkpointing has finished")
 
 
+def _copy_buffer(buffer_, file_):
+    buffer_.seek(0)
+    shutil.copyfileobj(buffer_, file_)
+
+
 class Load(SimpleExtension):
     """Loads a saved checkpoint into the main loop.
 
@@ -105,13 +105,16 @@ ensures that their hierarchical names are compatible with
 TODO: Add information about :func:`add_to_dump`.
 
 """
+import io
 import numpy
 import os
 import pickle
 import shutil
 import six
+import sys
 import tarfile
 import tempfile
+import time
 import warnings
 import logging
 from contextlib import closing
@@ -149,9 +152,18 @@ Because of limitations to pickling, this means that you will not be able to \
 resume your model outside of a namespace containing this function. In other \
 words, you can only call `continue_training` from within this script."""
 
+# Dumps of a main loop easily reach hundreds of megabytes, so temporary
+# files are written through a large buffer to avoid many small writes.
+_DUMP_BUFFER_SIZE = 4 * 2 ** 20
+if six.PY2:
+    _TEMP_FILE_BUFFERING = {'bufsize': _DUMP_BUFFER_SIZE}
+else:
+    _TEMP_FILE_BUFFERING = {'buffering': _DUMP_BUFFER_SIZE}
+
 
 def dump(object_, file_, parameters=None, use_cpickle=False,
-         protocol=DEFAULT_PROTOCOL, **kwargs):
+         protocol=DEFAULT_PROTOCOL, compress=False, compresslevel=1,
+         in_memory=False, **kwargs):
     r"""Pickles an object, optionally saving its parameters separately.
 
     Parameters
@@ -177,6 +189,21 @@ def dump(object_, file_, parameters=None, use_cpickle=False,
         The pickling protocol to use. Unlike Python's built-in pickle, the
         default is set to `2` instead of 0 for Python 2. The Python 3
         default (level 3) is maintained.
+    compress : bool
+        If True, the tarball is compressed with gzip. This reduces the
+        size of the dump only if the data is redundant: random-looking
+        float parameters shrink by a few percent while compression is
+        much slower than writing them as is. :func:`load` and
+        :func:`load_parameters` detect the compression automatically,
+        but :func:`add_to_dump` cannot append to a compressed archive.
+        Default: False.
+    compresslevel : int
+        The gzip compression level, from 1 (fastest) to 9 (smallest).
+        Only used if `compress` is True. Default: 1.
+    in_memory : bool
+        If True, the members of the archive are serialized in memory
+        instead of through temporary files on the disk. Useful when
+        `file_` is itself in memory. Default: False.
     \*\*kwargs
         Keyword arguments to be passed to `pickle.Pickler`.
 
@@ -185,23 +212,30 @@ def dump(object_, file_, parameters=None, use_cpickle=False,
         pickler = cPickle.Pickler
     else:
         pickler = _PicklerWithWarning
-    with closing(tarfile.TarFile(fileobj=file_, mode='w')) as tar_file:
+    if compress:
+        tar_file = tarfile.open(fileobj=file_, mode='w:gz',
+                                compresslevel=compresslevel)
+    else:
+        tar_file = tarfile.open(fileobj=file_, mode='w')
+    with closing(tar_file):
         external_objects = {}
 
         def _save_parameters(f):
             renamer = _Renamer()
             named_parameters = {renamer(p): p for p in parameters}
-            numpy.savez(f, **{n: p.get_value()
+            # The values are only read while saving, so there is no need
+            # to copy every parameter in memory first
+            numpy.savez(f, **{n: p.get_value(borrow=True)
                               for n, p in named_parameters.items()})
             for name, p in named_parameters.items():
                 array_ = p.container.storage[0]
                 external_objects[id(array_)] = _mangle_parameter_name(p, name)
         if parameters:
-            _taradd(_save_parameters, tar_file, '_parameters')
+            _taradd(_save_parameters, tar_file, '_parameters', in_memory)
         if object_ is not None:
             save_object = _SaveObject(pickler, object_, external_objects,
                                       protocol, **kwargs)
-            _taradd(save_object, tar_file, '_pkl')
+            _taradd(save_object, tar_file, '_pkl', in_memory)
 
 
 def secure_dump(object_, path, dump_function=dump, **kwargs):
@@ -224,15 +258,23 @@ def secure_dump(object_, path, dump_function=dump, **kwargs):
     try:
         logger.debug("Dumping object to a temporary file")
         with tempfile.NamedTemporaryFile(delete=False,
-                                         dir=config.temp_dir) as temp:
+                                         dir=config.temp_dir,
+                                         **_TEMP_FILE_BUFFERING) as temp:
             dump_function(object_, temp, **kwargs)
         logger.debug("Moving the temporary file")
         shutil.move(temp.name, path)
         logger.debug("Dump finished")
     except:  # noqa: E722
+        # Also clean up on KeyboardInterrupt, a partially written dump
+        # is useless and can take hundreds of megabytes.
+        exc_info = sys.exc_info()
         if "temp" in locals():
-            os.remove(temp.name)
-        raise
+            logger.debug("Dump failed, removing the temporary file")
+            try:
+                os.remove(temp.name)
+            except OSError:
+                pass
+        six.reraise(*exc_info)
 
 
 def load(file_, name='_pkl', use_cpickle=False, **kwargs):
@@ -300,7 +342,7 @@ def load_parameters(file_):
 
 
 def add_to_dump(object_, file_, name, parameters=None, use_cpickle=False,
-                protocol=DEFAULT_PROTOCOL, **kwargs):
+                protocol=DEFAULT_PROTOCOL, in_memory=False, **kwargs):
     r"""Pickles an object to an existing tar archive.
 
     This function allows to dump more objects to an existing archive. If
@@ -333,6 +375,10 @@ def add_to_dump(object_, file_, name, parameters=None, use_cpickle=False,
         The pickling protocol to use. Unlike Python's built-in pickle, the
         default is set to `2` instead of 0 for Python 2. The Python 3
         default (level 3) is maintained.
+    in_memory : bool
+        If True, the members of the archive are serialized in memory
+        instead of through temporary files on the disk. Useful when
+        `file_` is itself in memory. Default: False.
     \*\*kwargs
         Keyword arguments to be passed to `pickle.Pickler`.
 
@@ -373,7 +419,7 @@ def add_to_dump(object_, file_, name, parameters=None, use_cpickle=False,
     with closing(tarfile.TarFile(fileobj=file_, mode='a')) as tar_file:
         save_object = _SaveObject(pickler, object_, external_parameters,
                                   protocol, **kwargs)
-        _taradd(save_object, tar_file, name)
+        _taradd(save_object, tar_file, name, in_memory)
 
 
 def continue_training(path):
@@ -411,6 +457,7 @@ def continue_training(path):
 
 def dump_and_add_to_dump(object_, file_, parameters=None, to_add=None,
                          use_cpickle=False, protocol=DEFAULT_PROTOCOL,
+                         compress=False, compresslevel=1, in_memory=False,
                          **kwargs):
     r"""Calls both `dump` and `add_to_dump` to serialze several objects.
 
@@ -440,16 +487,28 @@ def dump_and_add_to_dump(object_, file_, parameters=None, to_add=None,
         The pickling protocol to use. Unlike Python's built-in pickle, the
         default is set to `2` instead of 0 for Python 2. The Python 3
         default (level 3) is maintained.
+    compress : bool
+        Compress the archive with gzip, see :func:`dump`. Can not be used
+        together with `to_add`. Default: False.
+    compresslevel : int
+        The gzip compression level, see :func:`dump`. Default: 1.
+    in_memory : bool
+        Serialize the members of the archive in memory, see :func:`dump`.
+        Default: False.
     \*\*kwargs
         Keyword arguments to be passed to `pickle.Pickler`.
 
     """
+    if compress and to_add:
+        raise ValueError("Objects can't be added to a compressed archive.")
     dump(object_, file_, parameters=parameters, use_cpickle=use_cpickle,
-         protocol=protocol, **kwargs)
+         protocol=protocol, compress=compress, compresslevel=compresslevel,
+         in_memory=in_memory, **kwargs)
     if to_add is not None:
         for name, obj in six.iteritems(to_add):
             add_to_dump(obj, file_, name, parameters=parameters,
-                        use_cpickle=use_cpickle, protocol=protocol, **kwargs)
+                        use_cpickle=use_cpickle, protocol=protocol,
+                        in_memory=in_memory, **kwargs)
 
 
 class _PicklerWithWarning(_Pickler):
@@ -634,7 +693,7 @@ def _unmangle_parameter_name(mangled_name):
     return _INVERSE_ARRAY_TYPE_MAP[type_], context_name, name
 
 
-def _taradd(func, tar_file, name):
+def _taradd(func, tar_file, name, in_memory=False):
     """Adds elements dumped by the function `func` to a tar_file.
 
     This functions first calls the function `func` and add the file that
@@ -648,14 +707,29 @@ def _taradd(func, tar_file, name):
         The archive that we are filling.
     name : str
         The name of the dumped file in the archive.
+    in_memory : bool
+        If True, `func` dumps to an in-memory buffer instead of a
+        temporary file.
 
     """
-    with tempfile.NamedTemporaryFile('wb', delete=False) as temp_file:
-        func(temp_file)
-        temp_file.close()
+    if in_memory:
+        buffer_ = io.BytesIO()
+        func(buffer_)
+        tar_info = tarfile.TarInfo(name)
+        tar_info.size = buffer_.tell()
+        tar_info.mtime = time.time()
+        buffer_.seek(0)
+        tar_file.addfile(tar_info, buffer_)
+        return
+    temp_file = tempfile.NamedTemporaryFile('wb', delete=False,
+                                            **_TEMP_FILE_BUFFERING)
+    try:
+        with temp_file:
+            func(temp_file)
         tar_file.add(temp_file.name, arcname=name)
-    if os.path.isfile(temp_file.name):
-        os.remove(temp_file.name)
+    finally:
+        if os.path.isfile(temp_file.name):
+            os.remove(temp_file.name)
 
 
 def _load_parameters_npzfile(file_):
@@ -1,4 +1,5 @@
 import os
+import pickle
 import numpy
 import tarfile
 import tempfile
@@ -100,6 +101,55 @@ class TestCheckpoint(unittest.TestCase):
         checkpoint.main_loop = self.main_loop
         self.assertRaises(AttributeError, checkpoint.do, None)
 
+    def test_checkpoint_protocol(self):
+        """Check that a checkpoint with the highest protocol is loadable."""
+        checkpoint = Checkpoint('myweirdmodel.tar',
+                                protocol=pickle.HIGHEST_PROTOCOL)
+        checkpoint.main_loop = self.main_loop
+        checkpoint.do(None)
+        old_value = self.W.get_value()
+        self.W.set_value(old_value * 2)
+        load = Load('myweirdmodel.tar')
+        load.main_loop = self.main_loop
+        load.do()
+        assert_allclose(self.W.get_value(), old_value)
+
+    def test_checkpoint_compress(self):
+        """Check that a compressed checkpoint is loadable."""
+        checkpoint = Checkpoint('myweirdmodel.tar', compress=True)
+        checkpoint.main_loop = self.main_loop
+        checkpoint.do(None)
+        with tarfile.open('myweirdmodel.tar', 'r:gz') as tarball:
+            assert set(tarball.getnames()) == set(['_pkl', '_parameters'])
+        old_value = self.W.get_value()
+        self.W.set_value(old_value * 2)
+        load = Load('myweirdmodel.tar', load_iteration_state=True)
+        load.main_loop = self.main_loop
+        load.do()
+        assert_allclose(self.W.get_value(), old_value)
+
+    def test_checkpoint_background(self):
+        """Check that a checkpoint written in background is loadable."""
+        checkpoint = Checkpoint('myweirdmodel.tar', background=True)
+        checkpoint.main_loop = self.main_loop
+        checkpoint.do(None)
+        old_value = self.W.get_value()
+        self.W.set_value(old_value * 2)
+        checkpoint.wait()
+        load = Load('myweirdmodel.tar')
+        load.main_loop = self.main_loop
+        load.do()
+        assert_allclose(self.W.get_value(), old_value)
+
+    def test_checkpoint_background_exception(self):
+        """Check that a failed background write is raised later."""
+        path = os.path.join(tempfile.mkdtemp(), 'missing', 'model.tar')
+        checkpoint = Checkpoint(path, background=True)
+        checkpoint.main_loop = self.main_loop
+        checkpoint.do(None)
+        self.assertRaises(IOError, checkpoint.do, None)
+        assert self.main_loop.log.current_row['saved_to'][-1] is None
+
     def tearDown(self):
         """Cleaning."""
         if os.path.exists('myweirdmodel.tar'):
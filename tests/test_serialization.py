@@ -1,6 +1,8 @@
 import os
+import shutil
 import warnings
 import tarfile
+import tempfile
 from pickle import PicklingError
 from io import BytesIO
 from tempfile import NamedTemporaryFile
@@ -15,7 +17,7 @@ from blocks.bricks import MLP, Linear
 from blocks.initialization import Constant
 from blocks.serialization import (load, dump, secure_dump, load_parameters,
                                   _Renamer, add_to_dump, dump_and_add_to_dump,
-                                  continue_training)
+                                  continue_training, _taradd)
 
 
 def test_renamer():
@@ -172,3 +174,35 @@ def test_protocol0_regression():
         load(buf)
     except TypeError:
         assert False  # Regression
+
+
+def test_compressed_dump():
+    brick = Linear(5, 10)
+    brick.allocate()
+    buf = BytesIO()
+    dump(brick, buf, parameters=list(brick.parameters), compress=True)
+    buf.seek(0)
+    with tarfile.open(fileobj=buf, mode='r:gz') as tarball:
+        assert set(tarball.getnames()) == set(['_pkl', '_parameters'])
+    buf.seek(0)
+    assert_allclose(load_parameters(buf)['/linear.W'],
+                    brick.W.get_value())
+    assert_allclose(load(buf).W.get_value(), brick.W.get_value())
+    assert_raises(ValueError, dump_and_add_to_dump, brick, BytesIO(),
+                  None, {'W': brick.W}, compress=True)
+
+
+def test_taradd_removes_temp_file():
+    def fail(f):
+        f.write(b'partial')
+        raise ValueError
+
+    old_tempdir = tempfile.tempdir
+    tempfile.tempdir = tempfile.mkdtemp()
+    try:
+        with tarfile.open(fileobj=BytesIO(), mode='w') as tar_file:
+            assert_raises(ValueError, _taradd, fail, tar_file, 'failed')
+        assert os.listdir(tempfile.tempdir) == []
+    finally:
+        shutil.rmtree(tempfile.tempdir)
+        tempfile.tempdir = old_tempdir